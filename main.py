@@ -815,6 +815,13 @@ async def main():
         raise
     finally:
         logger.info("Application shutting down")
+        await TapAzScraper.close_parse_pool()
         
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed; it is optional
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
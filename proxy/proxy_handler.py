@@ -181,6 +181,22 @@ class DataImpulseProxyHandler:
         # Store reference to the proxy handler in the scraper instance
         scraper_instance.proxy_handler = self
         
+        # TapAzScraper fetches details concurrently through its own session, rate
+        # limiter and retry loop, all of which send requests via proxy_url. Replacing
+        # its get_page_content would bypass them (and this handler's error path closes
+        # the session under the other in-flight requests), so it only gets proxy rotation
+        if 'TapAzScraper' in scraper_class_name:
+            def rotate_tap_proxy(failed_proxy: Optional[str]) -> None:
+                # Concurrent requests fail together; rotate once for the proxy they used
+                if failed_proxy == scraper_instance.proxy_url:
+                    self._rotate_proxy()
+                    scraper_instance.proxy_url = self.proxy_url
+            
+            scraper_instance.rotate_proxy = rotate_tap_proxy
+            # The scraper's limiter spaces requests across its concurrent fetches;
+            # hold it to this handler's tap.az pacing
+            scraper_instance.set_request_interval(self._get_site_settings('tap.az')['min_delay'])
+        
         async def new_get_page_content(url: str, params: Optional[dict] = None) -> str:
             max_retries = 3
             last_error = None
@@ -264,7 +280,8 @@ class DataImpulseProxyHandler:
             raise Exception(f"Max retries ({max_retries}) exceeded. Last error: {last_error}")
         
         # Replace the get_page_content method
-        scraper_instance.get_page_content = new_get_page_content
+        if 'TapAzScraper' not in scraper_class_name:
+            scraper_instance.get_page_content = new_get_page_content
         
         # For TapAzScraper, enhance the get_phone_numbers method if it exists
         if hasattr(scraper_instance, 'get_phone_numbers'):
@@ -274,6 +291,7 @@ class DataImpulseProxyHandler:
                 """Enhanced phone number fetching with proxy rotation support"""
                 try:
                     # Try the original method first
+                    used_proxy = scraper_instance.proxy_url
                     phones = await original_get_phone_numbers(listing_id)
                     
                     # If successful, return the phones
@@ -281,9 +299,8 @@ class DataImpulseProxyHandler:
                         return phones
                     
                     # If not successful, try rotating the proxy and trying again
-                    self._rotate_proxy()
-                    scraper_instance.proxy_url = self.proxy_url
-                    self.logger.info(f"Rotated proxy for phone API to: {self.proxy_url}")
+                    scraper_instance.rotate_proxy(used_proxy)
+                    self.logger.info(f"Rotated proxy for phone API to: {scraper_instance.proxy_url}")
                     
                     # Wait before retry
                     await asyncio.sleep(random.uniform(3, 5))
@@ -303,4 +320,5 @@ class DataImpulseProxyHandler:
                 scraper_instance.session = await self.create_session()
         
         # Replace the init_session method
-        scraper_instance.init_session = new_init_session
\ No newline at end of file
+        if 'TapAzScraper' not in scraper_class_name:
+            scraper_instance.init_session = new_init_session
\ No newline at end of file
@@ -1,47 +1,370 @@
 import asyncio
 import aiohttp
+import concurrent.futures
+import multiprocessing
 import random
 import os
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import logging
-from typing import Dict, List, Optional, Tuple
+import logging.handlers
+from typing import Callable, Dict, List, Optional, Tuple
 import datetime
+import email.utils
 import re
-import json
-import time
+import unicodedata
+import urllib.parse
+import orjson
+
+# Area ("85.5 m²"), room count ("3-otaqlı") and floor ("Mərtəbə: 2/5" or
+# "2/5 mərtəbə") share one pass over card text
+_META_RE = re.compile(
+    r'(?P<area>\d+(?:\.\d+)?)\s*m²'
+    r'|(?P<rooms>\d+)-otaqlı'
+    r'|mərtəbə:?\s*(?P<floor>\d+)/(?P<total>\d+)'
+    r'|(?P<floor_pre>\d+)/(?P<total_pre>\d+)\s*mərtəbə',
+    re.IGNORECASE
+)
+
+class _NumberChars(dict):
+    """
+    str.translate table keeping only digits and the decimal point.
+    
+    Entries are filled in the first time a character is seen, so later lookups
+    stay in C; this is faster than re.sub(r'[^\d.]', '', text) on short prices.
+    """
+    def __missing__(self, code: int) -> Optional[int]:
+        keep = code if chr(code).isdecimal() or code == 46 else None  # 46 is '.'
+        self[code] = keep
+        return keep
+
+_NUMBER_CHARS = _NumberChars()
+
+# Patterns used by the extract_* helpers, compiled once at import
+_DIGITS_RE = re.compile(r'\d+')
+_FRACTION_RE = re.compile(r'(\d+)/(\d+)')
+_AREA_RE = re.compile(r'(\d+(?:\.\d+)?)\s*m²')
+_ROOMS_RE = re.compile(r'(\d+)-otaqlı')
+_FLOOR_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'mərtəbə:\s*(\d+)/(\d+)',  # Mərtəbə: 2/5
+    r'(\d+)/(\d+)\s*mərtəbə',   # 2/5 mərtəbə
+    r'mərtəbə\s*(\d+)/(\d+)',   # mərtəbə 2/5
+    r'(\d+)-ci mərtəbə\/(\d+)', # 2-ci mərtəbə/5
+))
+# Every map implementation's coordinate markup in one alternation, so the page
+# is scanned once; each branch captures exactly two groups (lat, lon). The gaps
+# between the parts are bounded so a stray keyword cannot drag the lazy match
+# (and its backtracking) across the rest of the page
+_COORD_RE = re.compile(
+    # Standard patterns from various map implementations
+    r'lat="([^"]+)".{0,300}?lon="([^"]+)"'
+    # (starts at "lat=" like the branch above, so the scan offset can sit past "data-")
+    r'|(?<=data-)lat="([^"]+)".{0,300}?data-l(?:ng|on)="([^"]+)"'
+    # Google maps patterns
+    r'|google_map.{0,500}?value="\(([\d.]+),\s*([\d.]+)\)"'
+    r'|center=([\d.]+),([\d.]+)'
+    r'|google\.com/maps/embed[^"\'\s]*?q=([\d.]+),([\d.]+)'
+    # Leaflet patterns
+    r'|L\.marker\(\[([\d.]+),\s*([\d.]+)\]\)'
+    # General coordinate text patterns
+    r'|coordinates.{0,200}?([\d.]+),\s*([\d.]+)',
+    re.IGNORECASE | re.DOTALL
+)
+# Literal prefixes of the _COORD_RE branches ('lat=' also covers 'data-lat='),
+# matched with the same IGNORECASE; a match can only start at or after the first
+# of them, so the scan starts at the earliest one present
+_COORD_ANCHOR_RE = re.compile(
+    '|'.join(map(re.escape, (
+        'lat=', 'google_map', 'center=', 'google.com/maps/embed', 'L.marker', 'coordinates',
+    ))),
+    re.IGNORECASE
+)
+_BULLET_RE = re.compile(r'[•\-\*]\s*([^\n•\-\*]+)')
+# "Xəzər r.", "Xəzər rayonu", "Xəzər r-nu", "Xəzər rayon"
+_RAYON_RE = re.compile(r'(\w+)\s*(?:r\.|rayonu|r-nu|rayon)', re.IGNORECASE)
+# "Nizami m.", "Nizami metro", "Nizami m/st"
+_DISTRICT_METRO_RE = re.compile(r'(\w+)\s*(m\.|metro|m/st)', re.IGNORECASE)
+_WORD_SPLIT_RE = re.compile(r'[,\s.;:-]+')
+# Station name before the marker ("Nizami m.", "Nizami m/st", "Nizami metro",
+# "Nizami metrosu", "Nizami metro stansiyası") or after it ("m. Nizami",
+# "metro Nizami"), captured as (name, marker) or (marker, name)
+_METRO_RE = re.compile(
+    r'(\w+(?:\s+\w+)*)\s*(?=(m\.|m/st|metro))'
+    r'|(m\.|metro)\s*(?=(\w+(?:\s+\w+)*))',
+    re.IGNORECASE
+)
+# Candidates are tried by marker form first, then in text order
+_METRO_SUFFIX_RANK = {'m.': 0, 'metro': 1, 'm/st': 2}
+_METRO_PREFIX_RANK = {'m.': 3, 'metro': 4}
+_DIGIT_WORD_RE = re.compile(r'(\d+)\s*(\w+)')  # "20 Yanvar" or "28 May"
+
+# Azerbaijani capital İ lowercases to "i̇" (i + combining dot) rather than "i"
+_DOTTED_I = str.maketrans({'İ': 'i'})
+
+def _norm(text: str) -> str:
+    """Canonical form for case-insensitive matching: NFC, Azerbaijani İ, casefold"""
+    return unicodedata.normalize('NFC', text).translate(_DOTTED_I).casefold()
+
+# Valid Baku metro stations, spelled as they are displayed
+_METRO_STATIONS = (
+    "20 Yanvar", "28 May", "8 Noyabr", "Azadlıq prospekti", "Avtovağzal",
+    "Bakmil", "Cəfər Cabbarlı", "Dərnəgül", "Elmlər Akademiyası", "Əhmədli",
+    "Gənclik", "Həzi Aslanov", "Xalqlar dostluğu", "İçərişəhər", "İnşaatçılar",
+    "Koroğlu", "Qara Qarayev", "Memar Əcəmi", "Nəsimi", "Nərimanov",
+    "Neftçilər", "Nizami", "Sahil", "Xətai", "Xocəsən", "Ulduz",
+)
+# Display name returned by extract_metro_station, keyed by the normalized canonical name
+_METRO_DISPLAY = {_norm(station): station for station in _METRO_STATIONS}
+# Shortened and alternative spellings of stations
+_METRO_VARIATIONS = {
+    "20 yanvar": ("20 yanvar", "20yanvar", "yanvar"),
+    "28 may": ("28 may", "28may", "may"),
+    "8 noyabr": ("8 noyabr", "8noyabr", "noyabr"),
+    "həzi aslanov": ("həzi aslanov", "h.aslanov", "aslanov"),
+    "xalqlar dostluğu": ("xalqlar dostluğu", "dostluğu"),
+    "cəfər cabbarlı": ("cəfər cabbarlı", "cabbarlı"),
+    "elmlər akademiyası": ("elmlər akademiyası", "akademiyası"),
+    "memar əcəmi": ("memar əcəmi", "əcəmi"),
+    "qara qarayev": ("qara qarayev", "qarayev"),
+    "azadlıq prospekti": ("azadlıq prospekti", "azadlıq"),
+}
+# Every accepted form -> canonical station name; stations without variations map to themselves
+_METRO_MAPPING = {
+    variation: canonical
+    for canonical, variations in _METRO_VARIATIONS.items()
+    for variation in variations
+}
+_METRO_MAPPING.update({station: station for station in _METRO_DISPLAY if station not in _METRO_MAPPING})
+# Forms long enough for partial matching (short ones give false hits), with their character sets
+_METRO_PARTIALS = tuple(
+    (name, canonical, frozenset(name)) for name, canonical in _METRO_MAPPING.items() if len(name) > 5
+)
+
+# Valid Azerbaijan districts, spelled as they are displayed
+_DISTRICTS = (
+    "Ağdam", "Ağdaş", "Ağcabədi", "Ağstafa", "Ağsu", "Astara", "Babək", "Balakən", 
+    "Bərdə", "Beyləqan", "Biləsuvar", "Cəbrayıl", "Cəlilabad", "Culfa", "Daşkəsən", 
+    "Füzuli", "Gədəbəy", "Goranboy", "Göyçay", "Göygöl", "Hacıqabul", "Xaçmaz", 
+    "Xızı", "Xocalı", "Xocavənd", "İmişli", "İsmayıllı", "Kəlbəcər", "Kəngərli", 
+    "Kürdəmir", "Qəbələ", "Qax", "Qazax", "Qobustan", "Quba", "Qubadlı", "Qusar", 
+    "Laçın", "Lənkəran", "Lerik", "Masallı", "Neftçala", "Oğuz", "Ordubad", "Saatlı", 
+    "Sabirabad", "Sədərək", "Salyan", "Samux", "Şabran", "Şahbuz", "Şəki", "Şamaxı", 
+    "Şəmkir", "Şərur", "Şuşa", "Siyəzən", "Tərtər", "Tovuz", "Ucar", "Yardımlı", 
+    "Yevlax", "Zəngilan", "Zaqatala", "Zərdab", "Binəqədi", "Xətai", "Xəzər", 
+    "Qaradağ", "Nərimanov", "Nəsimi", "Nizami", "Pirallahı", "Sabunçu", "Səbail", 
+    "Suraxanı", "Yasamal"
+)
+_VALID_DISTRICTS = frozenset(map(_norm, _DISTRICTS))
+# Display form returned by extract_district, keyed by the normalized name
+_DISTRICT_DISPLAY = {_norm(district): district for district in _DISTRICTS}
+# A whole district name delimited the same way extract_district tokenizes text
+_DISTRICT_TOKEN_RE = re.compile(
+    r'(?<![^,\s.;:\-])(?:'
+    + '|'.join(map(re.escape, sorted(_VALID_DISTRICTS, key=len, reverse=True)))
+    + r')(?![^,\s.;:\-])'
+)
+_CSRF_RE = re.compile(r'<meta name="csrf-token" content="([^"]+)"')
+
+# Browser identities to rotate through when tap.az starts answering 403. Each is
+# a complete, self-consistent set: the same Chrome build on different platforms,
+# so the User-Agent never contradicts the client hints
+_CHROME_UA = 'Mozilla/5.0 ({}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+_BROWSER_PROFILES = tuple(
+    {
+        'User-Agent': _CHROME_UA.format(system),
+        'Sec-Ch-Ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        'Sec-Ch-Ua-Mobile': '?0',
+        'Sec-Ch-Ua-Platform': platform,
+    }
+    for system, platform in (
+        ('Macintosh; Intel Mac OS X 10_15_7', '"macOS"'),
+        ('Windows NT 10.0; Win64; x64', '"Windows"'),
+        ('X11; Linux x86_64', '"Linux"'),
+    )
+)
+
+# The phones endpoint returns a tiny JSON payload; share one timeout object for every call
+_PHONES_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Statuses with which the phones API rejects a stale CSRF token (Rails answers
+# an invalid authenticity token with 422)
+_CSRF_REJECTED = frozenset({401, 403, 422})
+
+# tap.az pages are a few hundred KB; anything far larger is an error page or a trap
+_MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+class _PageTooLarge(Exception):
+    """A response body exceeded _MAX_PAGE_BYTES; retrying would fetch it again"""
+
+
+# Property row values (lowercased) -> stored enum; checked in order, first keyword found wins
+_LISTING_TYPES = {
+    'kirayə': 'monthly',
+    'satış': 'sale',
+}
+_PROPERTY_TYPES = {
+    'yeni tikili': 'new',
+    'köhnə tikili': 'old',
+    'həyət evi': 'house',
+    'mənzil': 'apartment',
+}
+
+# A location mentioning any of these is a metro/district reference, not a street address
+_ADDR_DISQUALIFIERS = ('metro', 'rayon', 'district')
+
+def _text(node) -> Optional[str]:
+    """Stripped text of an optional node (None when the selector found nothing)"""
+    return node.text.strip() if node is not None else None
+
+def _index_classes(root) -> Dict[str, list]:
+    """Map every class name under root to the elements carrying it, in document order"""
+    nodes = {}
+    for elem in root.find_all(True):
+        for cls in elem.get('class', ()):
+            nodes.setdefault(cls, []).append(elem)
+    return nodes
+
+def _first(nodes: Dict[str, list], cls: str, name: Optional[str] = None):
+    """First element with class cls (and tag name, if given) in a _index_classes map"""
+    return next((elem for elem in nodes.get(cls, ()) if name is None or elem.name == name), None)
+
+def _match_keyword(table: Dict[str, str], text: str) -> Optional[str]:
+    """Look a value up in a keyword table: exact hit first, then the first keyword contained"""
+    hit = table.get(text)
+    if hit is None:
+        hit = next((value for keyword, value in table.items() if keyword in text), None)
+    return hit
+
+# Formatting characters stripped from phone numbers in one pass
+_PHONE_CLEAN = str.maketrans('', '', '()- ')
+
+# Listings pages only need the cards and the pagination block (for the next-page
+# cursor); the strainer sees the raw class attribute ("products-i rounded"), so
+# match the class as a whole word
+_CARDS_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)(?:products-i|pagination)(?:\s|$)'))
+
+# Detail pages only need the blocks the _SEL selectors read (and their children);
+# coordinates and the CSRF token are read from the raw HTML, not the soup
+_DETAIL_CLASSES = (
+    'product-title', 'product-description__content', 'product-properties', 'product-properties__i',
+    'product-owner__info-name', 'product-photos__slider-top', 'product-info__statistics__i-text',
+    'wp_status_ico', 'amenities', 'features', 'property-features',
+)
+_LISTING_STRAINER = SoupStrainer(
+    class_=re.compile(r'(?:^|\s)(?:' + '|'.join(map(re.escape, _DETAIL_CLASSES)) + r')(?:\s|$)')
+)
+
+class _RateLimiter:
+    """Token bucket shared by every request of a scraper: at most `rate` requests per second"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self._interval = 1.0 / rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = None
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) / self._interval)
+            self._updated = now
+            if self._tokens < 1:
+                # Hold the lock while waiting so callers are served in order
+                await asyncio.sleep((1 - self._tokens) * self._interval)
+                self._tokens = 1.0
+                self._updated = loop.time()
+            self._tokens -= 1
+    
+    async def __aexit__(self, *exc):
+        return False
 
 class TapAzScraper:
     """Scraper for tap.az real estate listings"""
     
     BASE_URL = "https://tap.az"
     LISTINGS_URL = "https://tap.az/elanlar/dasinmaz-emlak/menziller?keywords_source=typewritten"
+    # Per-listing URL templates, filled with the listing ID
+    LISTING_URL = BASE_URL + "/elanlar/dasinmaz-emlak/{}"
+    PHONES_URL = BASE_URL + "/ads/{}/phones"
+    
+    # CSS selectors compiled once and shared by every parse
+    _SEL = {
+        'desc': sv.compile('.product-description__content'),
+        'prop_name': sv.compile('.product-properties__i-name'),
+        'prop_value': sv.compile('.product-properties__i-value'),
+        'floor_text': sv.compile('.product-properties, .product-description__content'),
+        'amenity_sections': sv.compile('.amenities, .features, .property-features'),
+        'amenity_items': sv.compile('li, .item'),
+    }
     
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 5):
         """Initialize scraper with configuration"""
         self.logger = logging.getLogger(__name__)
         self.session = None
+        # Listings whose detail page and phones are processed at the same time
+        self._concurrency = int(os.getenv('TAP_CONCURRENCY', max_concurrent))
+        self.semaphore = asyncio.BoundedSemaphore(self._concurrency)
+        self._max_retries = int(os.getenv('MAX_RETRIES', 5))
+        self._delay = float(os.getenv('REQUEST_DELAY', 1))
+        # Cap on in-flight tap.az requests (pages, CSRF fetches and phone lookups,
+        # which overlap per listing), matched to the connector's per-host limit
+        # so requests wait here instead of queueing inside aiohttp
+        self._per_host = max(10, self._concurrency + 2)
+        self._tokens = asyncio.BoundedSemaphore(self._per_host)
+        # Aggregate request rate (requests/second) across concurrent fetches
+        self._limiter = _RateLimiter(float(os.getenv('REQUEST_RATE', 5)))
+        # Property label -> handler (or None), filled by _label_handler
+        self._resolved_labels: Dict[str, Optional[Callable]] = {}
+        # CSRF token for the phones API, valid for the whole session
+        self._csrf_token: Optional[str] = None
+        # Held while the token is refreshed, so concurrent lookups fetch it once
+        self._csrf_lock = asyncio.Lock()
+        # Browser identity sent with page requests; replaced on 403 (see _rotate_user_agent)
+        self._browser: Dict[str, str] = _BROWSER_PROFILES[0]
+        # Proxy every request goes through; set by the proxy handler, if one is applied
+        self.proxy_url: Optional[str] = None
+
+    def rotate_proxy(self, failed_proxy: Optional[str]):
+        """
+        Switch to another proxy exit after failed_proxy was blocked or timed out.
+        
+        Without a proxy there is nothing to switch; the proxy handler replaces
+        this method on the instances it is applied to.
+        """
+
+    def set_request_interval(self, seconds: float):
+        """Space page requests at least `seconds` apart, instead of the REQUEST_RATE default"""
+        self._limiter = _RateLimiter(1.0 / seconds)
 
     async def init_session(self):
         """Initialize aiohttp session with browser-like headers"""
         if not self.session:
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+                **_BROWSER_PROFILES[0],
                 'Accept': 'text/html, */*; q=0.01',
                 'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,az;q=0.6',
-                'Accept-Encoding': 'gzip, deflate, br',
                 'X-Requested-With': 'XMLHttpRequest',
                 'Connection': 'keep-alive',
                 'Cache-Control': 'max-age=0',
-                'Sec-Ch-Ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                'Sec-Ch-Ua-Mobile': '?0',
-                'Sec-Ch-Ua-Platform': '"macOS"',
                 'DNT': '1'
             }
             
             self.session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=30),
-                connector=aiohttp.TCPConnector(ssl=False)
+                connector=aiohttp.TCPConnector(
+                    ssl=False,
+                    # Room for every concurrent listing plus the prefetched listings page
+                    limit=max(20, self._concurrency * 2),
+                    limit_per_host=self._per_host,
+                    ttl_dns_cache=300,
+                    # Idle connections survive the inter-page pause and retry backoff
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True
+                )
             )
 
     async def close_session(self):
@@ -49,35 +372,120 @@ class TapAzScraper:
         if self.session:
             await self.session.close()
             self.session = None
+            # The token is tied to the session cookies
+            self._csrf_token = None
 
     async def get_page_content(self, url: str, cursor: Optional[str] = None) -> str:
         """Fetch page content with retry logic and anti-bot measures"""
-        MAX_RETRIES = int(os.getenv('MAX_RETRIES', 5))
-        DELAY = int(os.getenv('REQUEST_DELAY', 1))
-        
         params = {'cursor': cursor} if cursor else None
+        base = self._delay or 1.0
+        backoff = base
         
-        for attempt in range(MAX_RETRIES):
+        for attempt in range(self._max_retries):
+            retry_after = None
+            # Concurrent fetches fail together; only the first to see a failure
+            # switches the identity they all used
+            browser, proxy = self._browser, self.proxy_url
             try:
-                await asyncio.sleep(DELAY + random.random() * 2)
-                
-                async with self.session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    elif response.status == 403:
-                        self.logger.warning(f"Access forbidden (403) on attempt {attempt + 1}")
-                        await asyncio.sleep(DELAY * (attempt + 2))
-                    else:
-                        self.logger.warning(f"Failed to fetch {url}, status: {response.status}")
+                # The rate limiter does the spacing; the only sleeps are the retry backoff below
+                async with self._tokens, self._limiter:
+                    async with self.session.get(url, params=params, headers=browser, proxy=proxy) as response:
+                        if response.status == 200:
+                            return await self._read_page(response)
+                        elif response.status == 429:
+                            self.logger.warning(f"Rate limited (429) on attempt {attempt + 1}")
+                            retry_after = self._retry_after(response)
+                            self.rotate_proxy(proxy)
+                        elif response.status == 403:
+                            self.logger.warning(f"Access forbidden (403) on attempt {attempt + 1}")
+                            retry_after = self._retry_after(response)
+                            self._rotate_user_agent(browser)
+                            self.rotate_proxy(proxy)
+                        else:
+                            self.logger.warning(f"Failed to fetch {url}, status: {response.status}")
                         
+            except _PageTooLarge as e:
+                self.logger.error(f"Error fetching {url}: {str(e)}")
+                raise
+            except asyncio.TimeoutError:
+                self.logger.error(f"Timeout fetching {url} on attempt {attempt + 1}")
+                self.rotate_proxy(proxy)
+                if attempt == self._max_retries - 1:
+                    raise
             except Exception as e:
                 self.logger.error(f"Error fetching {url}: {str(e)}")
-                if attempt == MAX_RETRIES - 1:
+                if attempt == self._max_retries - 1:
                     raise
-                
-            await asyncio.sleep(DELAY * (attempt + 1))
+            
+            if attempt == self._max_retries - 1:
+                break
+            # Honor the server's Retry-After, otherwise use decorrelated jitter:
+            # each wait is drawn between REQUEST_DELAY and three times the last one
+            if retry_after is None:
+                backoff = min(30.0, random.uniform(base, backoff * 3))
+                retry_after = backoff
+            await asyncio.sleep(retry_after)
+        
+        raise Exception(f"Failed to fetch {url} after {self._max_retries} attempts")
+
+    async def _read_page(self, response: aiohttp.ClientResponse) -> str:
+        """
+        Read a page body in chunks as it arrives, giving up past _MAX_PAGE_BYTES.
+        
+        Args:
+            response: Successful response whose body is still unread
+            
+        Returns:
+            Decoded page; tap.az serves UTF-8, so aiohttp's charset sniffing is skipped
+            and only a different charset declared in Content-Type is honored
+        """
+        if response.content_length is not None and response.content_length > _MAX_PAGE_BYTES:
+            raise _PageTooLarge(f"page of {response.content_length} bytes exceeds {_MAX_PAGE_BYTES}")
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_any():
+            size += len(chunk)
+            if size > _MAX_PAGE_BYTES:
+                raise _PageTooLarge(f"page exceeds {_MAX_PAGE_BYTES} bytes")
+            chunks.append(chunk)
+        body = b''.join(chunks)
+        try:
+            return body.decode(response.charset or 'utf-8', 'replace')
+        except LookupError:
+            # Unknown charset name in the header
+            return body.decode('utf-8', 'replace')
+
+    def _rotate_user_agent(self, failed_browser: Dict[str, str]):
+        """Switch this scraper's page requests away from failed_browser, unless another request already did"""
+        if self._browser is failed_browser:
+            self._browser = random.choice([profile for profile in _BROWSER_PROFILES if profile is not failed_browser])
+
+    def _retry_after(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """
+        Read the Retry-After header of a throttled response.
         
-        raise Exception(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
+        Args:
+            response: Response carrying an optional Retry-After header
+            
+        Returns:
+            Seconds to wait (capped at 60), or None if the header is missing or invalid
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return min(60.0, max(0.0, float(value)))
+        except ValueError:
+            pass
+        # Otherwise it is an HTTP-date
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        wait = (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        return min(60.0, max(0.0, wait))
 
     def extract_number(self, text: str) -> Optional[float]:
         """Extract numeric value from text"""
@@ -85,7 +493,7 @@ class TapAzScraper:
             return None
         try:
             # Remove everything except digits and decimal point
-            clean_text = re.sub(r'[^\d.]', '', text)
+            clean_text = text.translate(_NUMBER_CHARS)
             return float(clean_text)
         except (ValueError, TypeError):
             return None
@@ -94,32 +502,26 @@ class TapAzScraper:
         """Extract area value from text"""
         if not text:
             return None
-        match = re.search(r'(\d+(?:\.\d+)?)\s*m²', text)
+        match = _AREA_RE.search(text)
         if match:
             try:
-                area = float(match.group(1))
-                
-                # Validate reasonable bounds
-                if area < 5 or area > 10000:
-                    self.logger.warning(f"Area value {area} m² outside reasonable bounds (5-10000)")
-                    return None
-                    
-                # Round to 2 decimal places
-                area = round(area, 2)
-                
-                # Ensure total digits don't exceed 10 (including decimal places)
-                str_area = f"{area:.2f}".replace('.', '')
-                if len(str_area) > 10:
-                    self.logger.warning(f"Area value {area} exceeds maximum digits (10)")
-                    return None
-                    
-                return area
-                
+                return self._validate_area(float(match.group(1)))
             except (ValueError, TypeError) as e:
                 self.logger.error(f"Error converting area value: {text} - {str(e)}")
                 return None
         return None
 
+    def _validate_area(self, area: float) -> Optional[float]:
+        """Apply bounds and precision checks to a parsed area value"""
+        # Validate reasonable bounds
+        if area < 5 or area > 10000:
+            self.logger.warning(f"Area value {area} m² outside reasonable bounds (5-10000)")
+            return None
+            
+        # Round to 2 decimal places; the bounds above already keep it within
+        # the column's 10 digits
+        return round(area, 2)
+
     def extract_rooms(self, text: str) -> Optional[int]:
         """
         Extract number of rooms from text. Returns 0 if room count exceeds 20.
@@ -133,18 +535,58 @@ class TapAzScraper:
         if not text:
             return None
             
-        match = re.search(r'(\d+)-otaqlı', text)
+        match = _ROOMS_RE.search(text)
         if match:
             try:
-                rooms = int(match.group(1))
-                if 1 <= rooms <= 20:  # Reasonable room range
-                    return rooms
-                elif rooms > 20:  # Handle cases with more than 20 rooms
-                    return 0
+                return self._validate_rooms(int(match.group(1)))
             except (ValueError, TypeError):
                 pass
                 
         return None
+
+    def _validate_rooms(self, rooms: int) -> Optional[int]:
+        """Map a parsed room count onto the accepted range (0 means more than 20)"""
+        if 1 <= rooms <= 20:  # Reasonable room range
+            return rooms
+        elif rooms > 20:  # Handle cases with more than 20 rooms
+            return 0
+        return None
+
+    def extract_meta(self, *texts: Optional[str]) -> Dict:
+        """
+        Extract area, rooms and floor from several texts with a single regex pass.
+        
+        Args:
+            *texts: Candidate texts in priority order (None entries are skipped)
+            
+        Returns:
+            Dict with area, rooms, floor and total_floors; each is the first valid
+            value found, or None
+        """
+        meta = {'area': None, 'rooms': None, 'floor': None, 'total_floors': None}
+        joined = ' | '.join(text for text in texts if text)
+        
+        for match in _META_RE.finditer(joined):
+            kind = match.lastgroup
+            if kind == 'area':
+                if meta['area'] is None:
+                    meta['area'] = self._validate_area(float(match.group('area')))
+            elif kind == 'rooms':
+                if meta['rooms'] is None:
+                    meta['rooms'] = self._validate_rooms(int(match.group('rooms')))
+            elif meta['floor'] is None:
+                if kind == 'total':
+                    floor, total = int(match.group('floor')), int(match.group('total'))
+                else:
+                    floor, total = int(match.group('floor_pre')), int(match.group('total_pre'))
+                # Same bounds as extract_floor_info
+                if 0 <= floor <= 200 and 1 <= total <= 200:
+                    meta['floor'], meta['total_floors'] = floor, total
+            
+            if None not in meta.values():
+                break
+                
+        return meta
     
     def extract_floor_info(self, text: str) -> Tuple[Optional[int], Optional[int]]:
         """
@@ -156,19 +598,13 @@ class TapAzScraper:
         Returns:
             Tuple of (current floor, total floors) if found, (None, None) otherwise
         """
-        if not text:
+        # Every pattern needs the word itself; most texts lack it. The stem is
+        # checked in both cases instead of lowercasing a whole description
+        if not text or ('ərtəbə' not in text and 'ƏRTƏBƏ' not in text):
             return None, None
             
-        # Common floor patterns
-        patterns = [
-            r'mərtəbə:\s*(\d+)/(\d+)',  # Mərtəbə: 2/5
-            r'(\d+)/(\d+)\s*mərtəbə',   # 2/5 mərtəbə
-            r'mərtəbə\s*(\d+)/(\d+)',   # mərtəbə 2/5
-            r'(\d+)-ci mərtəbə\/(\d+)', # 2-ci mərtəbə/5
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _FLOOR_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     current_floor = int(match.group(1))
@@ -192,41 +628,17 @@ class TapAzScraper:
         Returns:
             Tuple of (latitude, longitude) if found, (None, None) otherwise
         """
-        # For tap.az items, try different patterns to capture coordinates
-        
-        # First try to look for any explicit lat/lon in the page (most common in tap.az)
-        patterns = [
-            # Standard patterns from various map implementations
-            r'lat="([^"]+)".*?lon="([^"]+)"',
-            r'data-lat="([^"]+)".*?data-lng="([^"]+)"',
-            r'data-lat="([^"]+)".*?data-lon="([^"]+)"',
-            # Google maps patterns
-            r'google_map.*?value="\(([\d.]+),\s*([\d.]+)\)"',
-            r'center=([\d.]+),([\d.]+)',
-            # Leaflet patterns
-            r'L\.marker\(\[([\d.]+),\s*([\d.]+)\]\)',
-            # General coordinate text patterns
-            r'coordinates.*?([\d.]+),\s*([\d.]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
-            if match:
-                try:
-                    lat = float(match.group(1))
-                    lon = float(match.group(2))
-                    # Validate reasonable bounds for Azerbaijan
-                    if 38.0 <= lat <= 42.0 and 44.5 <= lon <= 51.0:
-                        return lat, lon
-                except (ValueError, TypeError, IndexError):
-                    pass
+        # Skip the page head (styles, scripts, navigation) up to the first map
+        # markup; pages without any skip the scan entirely
+        anchor = _COORD_ANCHOR_RE.search(html)
+        if anchor is None:
+            return None, None
         
-        # Additional pattern for google maps embed
-        iframe_match = re.search(r'google\.com/maps/embed.*?q=([\d.]+),([\d.]+)', html)
-        if iframe_match:
+        # Take the first match, in page order, that lies within Azerbaijan
+        for match in _COORD_RE.finditer(html, anchor.start()):
             try:
-                lat = float(iframe_match.group(1))
-                lon = float(iframe_match.group(2))
+                lat, lon = (float(group) for group in match.groups() if group is not None)
+                # Validate reasonable bounds for Azerbaijan
                 if 38.0 <= lat <= 42.0 and 44.5 <= lon <= 51.0:
                     return lat, lon
             except (ValueError, TypeError):
@@ -234,77 +646,97 @@ class TapAzScraper:
         
         return None, None
     
-    def extract_amenities(self, html: str) -> Optional[str]:
+    def _detail_texts(self, soup: BeautifulSoup) -> Dict:
         """
-        Extract amenities from the listing HTML.
+        Read the texts several extractors share, so the tree is searched once for each.
         
         Args:
-            html: HTML content of the listing detail page
+            soup: Parsed listing detail page
             
         Returns:
-            JSON string of amenities if found, None otherwise
+            Dict with 'nodes' (class name -> elements carrying it, in page order),
+            'rows' (stripped (label, lowercased label, value) triples of the product
+            properties that have both), 'title' and 'description' (stripped text or None)
         """
-        soup = BeautifulSoup(html, 'lxml')
-        amenities = []
+        # One walk over the strained tree indexes every element by class; the
+        # lookups below and in _parse_listing_detail_sync replace one soupsieve
+        # traversal per selector
+        nodes = _index_classes(soup)
         
-        # Look for property details section
-        for prop in soup.select('.product-properties__i'):
-            label = prop.select_one('.product-properties__i-name')
-            value = prop.select_one('.product-properties__i-value')
-            
+        rows = []
+        for prop in nodes.get('product-properties__i', ()):
+            label = self._SEL['prop_name'].select_one(prop)
+            value = self._SEL['prop_value'].select_one(prop)
             if label and value:
-                amenities.append(f"{label.text.strip()}: {value.text.strip()}")
+                label_text = label.text.strip()
+                rows.append((label_text, label_text.lower(), value.text.strip()))
+        
+        title_elem = _first(nodes, 'product-title', 'h1')
+        desc_elem = _first(nodes, 'product-description__content')
+        return {
+            'nodes': nodes,
+            'rows': rows,
+            'title': _text(title_elem),
+            'description': _text(desc_elem),
+        }
+
+    def extract_amenities(self, soup: BeautifulSoup, texts: Optional[Dict] = None) -> Optional[str]:
+        """
+        Extract amenities from the listing page.
+        
+        Args:
+            soup: Parsed listing detail page
+            texts: Shared texts already read by _detail_texts, to avoid searching for them again
+            
+        Returns:
+            JSON string of amenities if found, None otherwise
+        """
+        # Look for property details section
+        if texts is None:
+            texts = self._detail_texts(soup)
+        amenities = [f"{label_text}: {value_text}" for label_text, _, value_text in texts['rows']]
+        # Membership checks go through a set; the list keeps page order
+        seen = set(amenities)
         
-        # Look for other amenity sections if available
-        amenity_sections = soup.select('.amenities, .features, .property-features')
+        # Look for other amenity sections if available; most pages have none,
+        # which the class index answers without another traversal
+        nodes = texts['nodes']
+        has_sections = 'amenities' in nodes or 'features' in nodes or 'property-features' in nodes
+        amenity_sections = self._SEL['amenity_sections'].select(soup) if has_sections else ()
         for section in amenity_sections:
-            for item in section.select('li, .item'):
+            for item in self._SEL['amenity_items'].select(section):
                 text = item.text.strip()
-                if text and text not in amenities:
+                if text and text not in seen:
+                    seen.add(text)
                     amenities.append(text)
         
         # Extract features from description
-        desc_elem = soup.select_one('.product-description__content')
-        if desc_elem:
-            desc_text = desc_elem.text.strip()
+        desc_text = texts['description']
+        if desc_text:
             # Look for features marked with bullet points or dashes
-            bullet_items = re.findall(r'[•\-\*]\s*([^\n•\-\*]+)', desc_text)
+            bullet_items = _BULLET_RE.findall(desc_text)
             for item in bullet_items:
                 item_text = item.strip()
-                if item_text and len(item_text) < 100 and item_text not in amenities:
+                if item_text and len(item_text) < 100 and item_text not in seen:
+                    seen.add(item_text)
                     amenities.append(item_text)
         
         if amenities:
-            return json.dumps(amenities)
+            return orjson.dumps(amenities).decode()
         return None
 
-    def extract_district(self, html: str) -> Optional[str]:
+    def extract_district(self, soup: BeautifulSoup, texts: Optional[Dict] = None) -> Optional[str]:
         """
-        Extract district information from the listing HTML.
+        Extract district information from the listing page.
         Only returns a district if it matches one in the approved Azerbaijan districts list.
         
         Args:
-            html: HTML content of the listing detail page
+            soup: Parsed listing detail page
+            texts: Shared texts already read by _detail_texts, to avoid searching for them again
             
         Returns:
             District name if found and validated, None otherwise
         """
-        # List of valid Azerbaijan districts (lowercased for case-insensitive matching)
-        valid_districts = [
-            "ağdam", "ağdaş", "ağcabədi", "ağstafa", "ağsu", "astara", "babək", "balakən", 
-            "bərdə", "beyləqan", "biləsuvar", "cəbrayıl", "cəlilabad", "culfa", "daşkəsən", 
-            "füzuli", "gədəbəy", "goranboy", "göyçay", "göygöl", "hacıqabul", "xaçmaz", 
-            "xızı", "xocalı", "xocavənd", "imişli", "ismayıllı", "kəlbəcər", "kəngərli", 
-            "kürdəmir", "qəbələ", "qax", "qazax", "qobustan", "quba", "qubadlı", "qusar", 
-            "laçın", "lənkəran", "lerik", "masallı", "neftçala", "oğuz", "ordubad", "saatlı", 
-            "sabirabad", "sədərək", "salyan", "samux", "şabran", "şahbuz", "şəki", "şamaxı", 
-            "şəmkir", "şərur", "şuşa", "siyəzən", "tərtər", "tovuz", "ucar", "yardımlı", 
-            "yevlax", "zəngilan", "zaqatala", "zərdab", "binəqədi", "xətai", "xəzər", 
-            "qaradağ", "nərimanov", "nəsimi", "nizami", "pirallahı", "sabunçu", "səbail", 
-            "suraxanı", "yasamal"
-        ]
-        
-        soup = BeautifulSoup(html, 'lxml')
         district_candidates = []
         
         # First, get all possible location information from the property details
@@ -312,76 +744,27 @@ class TapAzScraper:
         location = None
         
         # Check product properties
-        for prop in soup.select('.product-properties__i'):
-            label = prop.select_one('.product-properties__i-name')
-            value = prop.select_one('.product-properties__i-value')
-            
-            if not label or not value:
-                continue
-                
-            label_text = label.text.strip().lower()
-            value_text = value.text.strip()
-            
-            if 'şəhər' in label_text:
+        if texts is None:
+            texts = self._detail_texts(soup)
+        for _, label_lower, value_text in texts['rows']:
+            if 'şəhər' in label_lower:
                 city = value_text
                 district_candidates.append(value_text)
-            elif 'yerləşmə yeri' in label_text:
+            elif 'yerləşmə yeri' in label_lower:
                 location = value_text
                 district_candidates.append(value_text)
         
         # Try to extract from title and description as well
-        title_elem = soup.select_one('h1.product-title')
-        if title_elem:
-            district_candidates.append(title_elem.text.strip())
+        if texts['title'] is not None:
+            district_candidates.append(texts['title'])
         
-        desc_elem = soup.select_one('.product-description__content')
-        if desc_elem:
-            district_candidates.append(desc_elem.text.strip())
-        
-        # Process each candidate location to extract potential district names
-        extracted_districts = []
+        if texts['description'] is not None:
+            district_candidates.append(texts['description'])
         
         for text in district_candidates:
-            if not text:
-                continue
-                
-            # Try to match district with r. or rayon pattern
-            district_patterns = [
-                r'(\w+)\s*r\.',           # "Xəzər r."
-                r'(\w+)\s*rayonu',        # "Xəzər rayonu"
-                r'(\w+)\s*r-nu',          # "Xəzər r-nu"
-                r'(\w+)\s*rayon'          # "Xəzər rayon"
-            ]
-            
-            for pattern in district_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    district_name = match.group(1).strip().lower()
-                    extracted_districts.append(district_name)
-            
-            # Also check for metro stations that match district names
-            metro_patterns = [
-                r'(\w+)\s*m\.',           # "Nizami m."
-                r'(\w+)\s*metro',         # "Nizami metro"
-                r'(\w+)\s*m/st'           # "Nizami m/st"
-            ]
-            
-            for pattern in metro_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    district_name = match.group(1).strip().lower()
-                    extracted_districts.append(district_name)
-            
-            # Also add raw words that might be districts
-            words = re.split(r'[,\s.;:-]+', text.lower())
-            extracted_districts.extend(words)
-        
-        # Now validate against the list of actual districts
-        for candidate in extracted_districts:
-            candidate = candidate.lower()
-            if candidate in valid_districts:
-                # Return with proper capitalization
-                return candidate.capitalize()
+            district = self._try_district(text)
+            if district:
+                return district
         
         # Handle special metro cases that correspond to districts
         # if location:
@@ -394,80 +777,79 @@ class TapAzScraper:
         # No valid district found
         return None
     
-    def extract_metro_station(self, html: str) -> Optional[str]:
+    def _try_district(self, text: str) -> Optional[str]:
         """
-        Extract metro station information from the listing HTML.
-        Only returns a metro station if it matches one in the approved Baku metro stations list.
+        Find a valid district in a single text.
+        
+        Candidates are tried in order: rayon hints ("Xəzər r."), metro hints
+        ("Nizami m."), then any raw word of the text.
         
         Args:
-            html: HTML content of the listing detail page
+            text: Location, title or description text
             
         Returns:
-            Metro station name if found and validated, None otherwise
+            Capitalized district name, or None if the text names no valid district
         """
-        # List of valid Baku metro stations (lowercased for case-insensitive matching)
-        valid_metro_stations = [
-            "20 yanvar", "28 may", "8 noyabr", "azadlıq prospekti", "avtovağzal", 
-            "bakmil", "cəfər cabbarlı", "dərnəgül", "elmlər akademiyası", "əhmədli", 
-            "gənclik", "həzi aslanov", "xalqlar dostluğu", "içərişəhər", "inşaatçılar", 
-            "koroğlu", "qara qarayev", "memar əcəmi", "nəsimi", "nərimanov", 
-            "neftçilər", "nizami", "sahil", "xətai", "xocəsən", "ulduz"
-        ]
-        
-        # Normalized forms for special cases (e.g., shortened versions)
-        normalized_stations = {
-            "20 yanvar": ["20 yanvar", "20yanvar", "yanvar"],
-            "28 may": ["28 may", "28may", "may"],
-            "8 noyabr": ["8 noyabr", "8noyabr", "noyabr"],
-            "həzi aslanov": ["həzi aslanov", "h.aslanov", "aslanov"],
-            "xalqlar dostluğu": ["xalqlar dostluğu", "dostluğu"],
-            "cəfər cabbarlı": ["cəfər cabbarlı", "cabbarlı"],
-            "elmlər akademiyası": ["elmlər akademiyası", "akademiyası"],
-            "memar əcəmi": ["memar əcəmi", "əcəmi"],
-            "qara qarayev": ["qara qarayev", "qarayev"],
-            "azadlıq prospekti": ["azadlıq prospekti", "azadlıq"]
-        }
+        if not text:
+            return None
         
-        # Mapping for various alternative forms to canonical names
-        metro_mapping = {}
-        for canonical, variations in normalized_stations.items():
-            for variation in variations:
-                metro_mapping[variation] = canonical
+        # Normalize once; every scan below runs on the folded text
+        text_lower = _norm(text)
         
-        # For stations not in the mapping, add a direct mapping to themselves
-        for station in valid_metro_stations:
-            if station not in metro_mapping:
-                metro_mapping[station] = station
+        # Skip the hint scans when their suffixes are absent
+        if 'r.' in text_lower or 'ray' in text_lower or 'r-n' in text_lower:
+            for match in _RAYON_RE.finditer(text_lower):
+                district_name = match.group(1).strip()
+                if district_name in _VALID_DISTRICTS:
+                    # Return with proper capitalization
+                    return _DISTRICT_DISPLAY[district_name]
         
-        soup = BeautifulSoup(html, 'lxml')
+        # Also check for metro stations that match district names
+        if 'm.' in text_lower or 'metro' in text_lower or 'm/st' in text_lower:
+            # One scan; hits are tried "m." first, then "metro", then "m/st"
+            hits = sorted(_DISTRICT_METRO_RE.findall(text_lower), key=lambda hit: _METRO_SUFFIX_RANK[hit[1]])
+            for district_name, _ in hits:
+                district_name = district_name.strip()
+                if district_name in _VALID_DISTRICTS:
+                    return _DISTRICT_DISPLAY[district_name]
+        
+        # A single scan finds the first raw word that is a district
+        match = _DISTRICT_TOKEN_RE.search(text_lower)
+        if match:
+            return _DISTRICT_DISPLAY[match.group(0)]
+        return None
+    
+    def extract_metro_station(self, soup: BeautifulSoup, texts: Optional[Dict] = None) -> Optional[str]:
+        """
+        Extract metro station information from the listing page.
+        Only returns a metro station if it matches one in the approved Baku metro stations list.
+        
+        Args:
+            soup: Parsed listing detail page
+            texts: Shared texts already read by _detail_texts, to avoid searching for them again
+            
+        Returns:
+            Metro station name if found and validated, None otherwise
+        """
         metro_candidates = []
         
         # First, get all possible location information from the property details
         location = None
         
         # Check product properties
-        for prop in soup.select('.product-properties__i'):
-            label = prop.select_one('.product-properties__i-name')
-            value = prop.select_one('.product-properties__i-value')
-            
-            if not label or not value:
-                continue
-                
-            label_text = label.text.strip().lower()
-            value_text = value.text.strip()
-            
-            if 'yerləşmə yeri' in label_text:
+        if texts is None:
+            texts = self._detail_texts(soup)
+        for _, label_lower, value_text in texts['rows']:
+            if 'yerləşmə yeri' in label_lower:
                 location = value_text
                 metro_candidates.append(value_text)
         
         # Try to extract from title and description as well
-        title_elem = soup.select_one('h1.product-title')
-        if title_elem:
-            metro_candidates.append(title_elem.text.strip())
+        if texts['title'] is not None:
+            metro_candidates.append(texts['title'])
         
-        desc_elem = soup.select_one('.product-description__content')
-        if desc_elem:
-            metro_candidates.append(desc_elem.text.strip())
+        if texts['description'] is not None:
+            metro_candidates.append(texts['description'])
         
         # Process each candidate location to extract potential metro station names
         extracted_stations = []
@@ -475,30 +857,28 @@ class TapAzScraper:
         for text in metro_candidates:
             if not text:
                 continue
+            
+            # Normalize once; the patterns and the word split both use it
+            text_lower = _norm(text)
                 
             # Try to match metro station with m. or metro pattern
-            metro_patterns = [
-                r'(\w+(?:\s+\w+)*)\s*m\.',           # "Nizami m."
-                r'(\w+(?:\s+\w+)*)\s*metro',         # "Nizami metro"
-                r'(\w+(?:\s+\w+)*)\s*m/st',          # "Nizami m/st"
-                r'(\w+(?:\s+\w+)*)\s*metrosu',       # "Nizami metrosu"
-                r'm\.\s*(\w+(?:\s+\w+)*)',           # "m. Nizami"
-                r'metro\s*(\w+(?:\s+\w+)*)',         # "metro Nizami"
-                r'(\w+(?:\s+\w+)*)\s*metro\s+stansiyası'  # "Nizami metro stansiyası"
-            ]
-            
-            for pattern in metro_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    station_name = match.group(1).strip().lower()
-                    extracted_stations.append(station_name)
-                    
-                    # Also try without spaces for compound names (e.g. "20Yanvar")
-                    if ' ' in station_name:
-                        extracted_stations.append(station_name.replace(' ', ''))
+            ranked = []
+            for name, suffix, prefix, prefixed_name in _METRO_RE.findall(text_lower):
+                if suffix:
+                    ranked.append((_METRO_SUFFIX_RANK[suffix], name.strip()))
+                else:
+                    ranked.append((_METRO_PREFIX_RANK[prefix], prefixed_name.strip()))
+            # Stable sort keeps text order within each marker form
+            ranked.sort(key=lambda item: item[0])
+            for _, station_name in ranked:
+                extracted_stations.append(station_name)
+                
+                # Also try without spaces for compound names (e.g. "20Yanvar")
+                if ' ' in station_name:
+                    extracted_stations.append(station_name.replace(' ', ''))
             
             # Also add raw words that might be metro stations
-            words = re.split(r'[,\s.;:-]+', text.lower())
+            words = _WORD_SPLIT_RE.split(text_lower)
             # Only consider words that could be metro stations (e.g., proper names)
             potential_words = [w for w in words if len(w) > 3 and w[0].isalpha()]
             extracted_stations.extend(potential_words)
@@ -506,173 +886,186 @@ class TapAzScraper:
         # Add special case handling for metro stations commonly formatted with digits
         for text in metro_candidates:
             # Special pattern for "20 Yanvar", "28 May", etc.
-            digit_patterns = [
-                r'(\d+)\s*(\w+)',  # "20 Yanvar" or "28 May"
-            ]
-            
-            for pattern in digit_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    digit = match.group(1)
-                    name = match.group(2).lower()
-                    
-                    # Check common date-based metro stations
-                    if digit == "20" and name in ["yanvar", "january"]:
-                        extracted_stations.append("20 yanvar")
-                    elif digit == "28" and name in ["may"]:
-                        extracted_stations.append("28 may")
-                    elif digit == "8" and name in ["noyabr", "november"]:
-                        extracted_stations.append("8 noyabr")
+            for match in _DIGIT_WORD_RE.finditer(text):
+                digit = match.group(1)
+                name = match.group(2).lower()
+                
+                # Check common date-based metro stations
+                if digit == "20" and name in ["yanvar", "january"]:
+                    extracted_stations.append("20 yanvar")
+                elif digit == "28" and name in ["may"]:
+                    extracted_stations.append("28 may")
+                elif digit == "8" and name in ["noyabr", "november"]:
+                    extracted_stations.append("8 noyabr")
         
         # Now validate against the mapping of metro stations
         for candidate in extracted_stations:
-            # Try to find in metro_mapping (including variations)
-            if candidate in metro_mapping:
-                canonical = metro_mapping[candidate]
-                return canonical.capitalize()
+            # Try to find in _METRO_MAPPING (including variations)
+            if candidate in _METRO_MAPPING:
+                canonical = _METRO_MAPPING[candidate]
+                return _METRO_DISPLAY[canonical]
             
             # Try partial matching for longer station names
-            for valid_name, canonical in metro_mapping.items():
+            candidate_chars = None
+            for valid_name, canonical, valid_chars in _METRO_PARTIALS:
                 # Check if candidate is a substantial part of a valid station name
-                # Only for longer station names (to avoid false matches with short names)
-                if len(valid_name) > 5 and (valid_name in candidate or candidate in valid_name):
-                    similarity = len(set(valid_name) & set(candidate)) / len(set(valid_name) | set(candidate))
+                if valid_name in candidate or candidate in valid_name:
+                    if candidate_chars is None:
+                        candidate_chars = frozenset(candidate)
+                    similarity = len(valid_chars & candidate_chars) / len(valid_chars | candidate_chars)
                     if similarity > 0.7:  # Threshold for similarity
-                        return canonical.capitalize()
+                        return _METRO_DISPLAY[canonical]
         
-        # Handle special cases from location text
-        if location:
-            location_lower = location.lower()
-                    
         # No valid metro station found
         return None
 
+    def _extract_csrf(self, html: str) -> Optional[str]:
+        """Read the CSRF token from the meta tag tap.az puts on every page"""
+        match = _CSRF_RE.search(html)
+        return match.group(1) if match else None
+
+    async def _fetch_csrf_token(self, listing_id: str) -> Optional[str]:
+        """
+        Visit a listing page to obtain a CSRF token (and the session cookies,
+        which the cookie jar keeps for the phones request).
+        
+        Args:
+            listing_id: Listing whose page is used to obtain the token
+            
+        Returns:
+            CSRF token if found, None otherwise
+        """
+        listing_url = self.LISTING_URL.format(listing_id)
+        
+        self.logger.info(f"Fetching listing page to get cookies and CSRF token: {listing_url}")
+        
+        async with self._tokens, self.session.get(
+            listing_url,
+            proxy=self.proxy_url,
+            headers={
+                # Same browser identity as the page requests on this cookie session
+                **self._browser,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,az;q=0.6',
+                'Referer': 'https://tap.az/',
+                'DNT': '1',
+                'Connection': 'keep-alive'
+            }
+        ) as response:
+            self.logger.info(f"Listing page response status: {response.status}")
+            
+            if response.status != 200:
+                self.logger.warning(f"Failed to fetch listing page: {response.status}")
+                return None
+            
+            # Extract CSRF token - using the exact meta tag format seen in tap.az
+            csrf_token = self._extract_csrf(await response.text())
+            if csrf_token:
+                self.logger.info(f"Extracted CSRF token: {csrf_token}")
+                self._csrf_token = csrf_token
+            return csrf_token
+
+    async def _get_csrf_token(self, listing_id: str) -> Optional[str]:
+        """Cached CSRF token, fetched first if none is known"""
+        if self._csrf_token is None:
+            async with self._csrf_lock:
+                # Another lookup may have fetched one while this one waited for the lock
+                if self._csrf_token is None:
+                    await self._fetch_csrf_token(listing_id)
+        return self._csrf_token
+
     async def get_phone_numbers(self, listing_id: str) -> List[str]:
         """
         Fetch phone numbers from tap.az API with correct headers and request method.
         Uses POST instead of GET and includes all required headers.
+        
+        The CSRF token is cached for the session (parse_listing_detail seeds it from
+        the detail page), so the listing page is only fetched when no token is known
+        or the API rejects the cached one.
         """
         try:
             # Construct the proper API URL
-            url = f"https://tap.az/ads/{listing_id}/phones"
-            
-            # First visit the actual listing page to get cookies and CSRF token
-            listing_url = f"https://tap.az/elanlar/dasinmaz-emlak/{listing_id}"
-            
-            self.logger.info(f"Fetching listing page to get cookies and CSRF token: {listing_url}")
+            url = self.PHONES_URL.format(listing_id)
             
             # Make sure we have a session
             if not self.session:
                 await self.init_session()
             
-            # First get the listing page to get cookies and CSRF token
-            async with self.session.get(
-                listing_url,
-                proxy=self.proxy_url,
-                allow_redirects=True,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,az;q=0.6',
-                    'Referer': 'https://tap.az/',
-                    'DNT': '1',
-                    'Sec-Ch-Ua': '"Chromium";v="134", "Not:A-Brand";v="24", "Google Chrome";v="134"',
-                    'Sec-Ch-Ua-Mobile': '?0',
-                    'Sec-Ch-Ua-Platform': '"macOS"',
-                    'Connection': 'keep-alive'
-                }
-            ) as response:
-                self.logger.info(f"Listing page response status: {response.status}")
-                
-                if response.status != 200:
-                    self.logger.warning(f"Failed to fetch listing page: {response.status}")
+            for attempt in range(2):
+                csrf_token = await self._get_csrf_token(listing_id)
+                if not csrf_token:
+                    self.logger.error("Failed to extract CSRF token")
                     return []
                 
-                # Get the HTML content to extract CSRF token
-                html_content = await response.text()
+                # Add small delay to mimic human behavior
+                await asyncio.sleep(random.uniform(0.5, 1.5))
                 
-                # Extract CSRF token - using the exact meta tag format seen in tap.az
-                csrf_token = None
-                csrf_match = re.search(r'<meta name="csrf-token" content="([^"]+)"', html_content)
-                if csrf_match:
-                    csrf_token = csrf_match.group(1)
-                    self.logger.info(f"Extracted CSRF token: {csrf_token}")
+                # Prepare headers for the POST request
+                headers = {
+                    # Same browser identity as the page requests on this cookie session
+                    **self._browser,
+                    'Accept': '*/*',
+                    'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,az;q=0.6',
+                    'Referer': self.LISTING_URL.format(listing_id),
+                    'Origin': 'https://tap.az',
+                    'Connection': 'keep-alive',
+                    'X-Requested-With': 'XMLHttpRequest',
+                    'X-CSRF-Token': csrf_token,
+                    'Sec-Fetch-Dest': 'empty',
+                    'Sec-Fetch-Mode': 'cors',
+                    'Sec-Fetch-Site': 'same-origin',
+                    'DNT': '1'
+                }
                 
-                # Also get any cookies set in the response
-                cookies = {}
-                for cookie_name, cookie in response.cookies.items():
-                    cookies[cookie_name] = cookie.value
-                    self.logger.debug(f"Cookie: {cookie_name}={cookie.value}")
+                self.logger.info(f"Making POST request to get phone numbers for listing {listing_id}")
                 
-                # Add request_method cookie which is required
-                cookies['request_method'] = 'POST'
-            
-            if not csrf_token:
-                self.logger.error("Failed to extract CSRF token")
-                return []
-            
-            # Add small delay to mimic human behavior
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-            
-            # Prepare headers for the POST request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
-                'Accept': '*/*',
-                'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7,az;q=0.6',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': f"https://tap.az/elanlar/dasinmaz-emlak/{listing_id}",
-                'Origin': 'https://tap.az',
-                'Connection': 'keep-alive',
-                'X-Requested-With': 'XMLHttpRequest',
-                'X-CSRF-Token': csrf_token,
-                'Sec-Fetch-Dest': 'empty',
-                'Sec-Fetch-Mode': 'cors',
-                'Sec-Fetch-Site': 'same-origin',
-                'Sec-Ch-Ua': '"Chromium";v="134", "Not:A-Brand";v="24", "Google Chrome";v="134"',
-                'Sec-Ch-Ua-Mobile': '?0',
-                'Sec-Ch-Ua-Platform': '"macOS"',
-                'DNT': '1'
-            }
-            
-            self.logger.info(f"Making POST request to get phone numbers for listing {listing_id}")
-            
-            # Make the POST request with proper headers, cookies, and method
-            async with self.session.post(
-                url,
-                headers=headers,
-                cookies=cookies,
-                proxy=self.proxy_url,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                self.logger.info(f"Phone API response status: {response.status}")
-                
-                if response.status == 200:
-                    # Parse JSON response
-                    try:
-                        data = await response.json()
-                        self.logger.info(f"Successfully retrieved phone number data")
-                        
-                        if isinstance(data, dict) and 'phones' in data:
-                            phones = data['phones']
-                            self.logger.info(f"Found phone numbers: {phones}")
-                            return phones
+                # Session cookies come from the cookie jar; request_method is required on top
+                async with self._tokens, self.session.post(
+                    url,
+                    headers=headers,
+                    cookies={'request_method': 'POST'},
+                    proxy=self.proxy_url,
+                    timeout=_PHONES_TIMEOUT
+                ) as response:
+                    self.logger.info(f"Phone API response status: {response.status}")
+                    
+                    if response.status in _CSRF_REJECTED:
+                        # The token has expired; drop it so no later lookup reuses it, and
+                        # retry this one once with a fresh token. A concurrent lookup may
+                        # already have replaced it, and that newer token is kept
+                        if self._csrf_token == csrf_token:
+                            self._csrf_token = None
+                        if attempt == 0:
+                            self.logger.warning(f"Phone API rejected the CSRF token ({response.status}), refreshing it")
+                            continue
+                    
+                    # Read the body once; both the JSON parse and the error logs use it
+                    body = await response.read()
+                    
+                    if response.status == 200:
+                        # Parse JSON response
+                        try:
+                            data = orjson.loads(body)
+                            self.logger.info(f"Successfully retrieved phone number data")
                             
-                        self.logger.warning(f"Unexpected response format: {data}")
-                        return []
-                        
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Failed to parse JSON response: {e}")
-                        response_text = await response.text()
-                        self.logger.error(f"Response content: {response_text[:200]}")
+                            if isinstance(data, dict) and 'phones' in data:
+                                phones = data['phones']
+                                self.logger.info(f"Found phone numbers: {phones}")
+                                return phones
+                                
+                            self.logger.warning(f"Unexpected response format: {data}")
+                            return []
+                            
+                        except orjson.JSONDecodeError as e:
+                            self.logger.error(f"Failed to parse JSON response: {e}")
+                            self.logger.error(f"Response content: {body[:200].decode('utf-8', 'replace')}")
+                            return []
+                    else:
+                        self.logger.warning(f"Failed to get phone numbers: status {response.status}")
+                        self.logger.error(f"Error response: {body[:200].decode('utf-8', 'replace')}")
                         return []
-                else:
-                    self.logger.warning(f"Failed to get phone numbers: status {response.status}")
-                    try:
-                        error_text = await response.text()
-                        self.logger.error(f"Error response: {error_text[:200]}")
-                    except:
-                        pass
-                    return []
+            
+            return []
                     
         except Exception as e:
             self.logger.error(f"Error fetching phone numbers for listing {listing_id}: {str(e)}")
@@ -680,48 +1073,91 @@ class TapAzScraper:
             return []
         
     
-    async def parse_listing_page(self, html: str) -> List[Dict]:
-        """Parse the listings page and extract basic listing information"""
+    @staticmethod
+    async def close_parse_pool():
+        """Stop the parse worker processes and wait for them; call once at application shutdown"""
+        await asyncio.to_thread(_shutdown_parse_pool)
+
+    async def _run_parser(self, func: Callable, *args):
+        """
+        Run a parse entry point in the worker pool.
+        
+        A worker that dies (OOM kill, crash in lxml) breaks the whole pool, so a
+        broken pool is replaced with a fresh one and the parse is retried once.
+        """
+        loop = asyncio.get_running_loop()
+        pool = _parse_pool()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except concurrent.futures.process.BrokenProcessPool:
+            self.logger.warning("A parse worker died; restarting the parse pool")
+            _discard_parse_pool(pool)
+            return await loop.run_in_executor(_parse_pool(), func, *args)
+
+    async def parse_listing_page(self, html: str, now: datetime.datetime) -> Tuple[List[Dict], Optional[str]]:
+        """Parse the listings page in a worker process to keep the event loop free"""
+        return await self._run_parser(_parse_listing_page_worker, html, now)
+
+    def _next_cursor(self, pagination) -> Optional[str]:
+        """Cursor query parameter of the pagination block's "next" link, if any"""
+        link = pagination.find('a', rel='next')
+        if link is None or not link.get('href'):
+            return None
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(link['href']).query)
+        return query.get('cursor', [None])[0]
+
+    def _parse_listing_page_sync(self, html: str, now: datetime.datetime) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Parse the listings page and extract basic listing information.
+        
+        Returns:
+            The listing cards and the cursor of the next page (None if there is no next link)
+        """
         listings = []
-        soup = BeautifulSoup(html, 'lxml')
+        next_cursor = None
+        soup = BeautifulSoup(html, 'lxml', parse_only=_CARDS_STRAINER)
         
-        for listing in soup.select('.products-i'):
+        # The strainer leaves only the cards and the pagination at the top level
+        for listing in soup.find_all(True, recursive=False):
+            if 'pagination' in listing.get('class', ()):
+                next_cursor = next_cursor or self._next_cursor(listing)
+                continue
             try:
+                # One walk per card indexes its elements by class, instead of one
+                # selector traversal per field; the fields below are read as text
+                nodes = _index_classes(listing)
+                
                 # Get listing URL and ID
-                link = listing.select_one('a.products-link')
+                link = _first(nodes, 'products-link', 'a')
                 if not link:
                     continue
                     
-                listing_url = self.BASE_URL + link['href']
-                listing_id = link['href'].split('/')[-1]
+                href = link['href']
+                listing_url = self.BASE_URL + href
+                listing_id = href.rpartition('/')[2]
                 
                 # Extract price
-                price_elem = listing.select_one('.price-val')
-                price = self.extract_number(price_elem.text) if price_elem else None
+                price = self.extract_number(_text(_first(nodes, 'price-val')))
                 
                 # Extract title and metadata
-                title = listing.select_one('.products-name')
-                title_text = title.text.strip() if title else None
-                
-                # Extract area and rooms
-                area = None
-                rooms = None
+                title_text = _text(_first(nodes, 'products-name'))
                 
-                # Try to extract area and rooms from both title and description
-                for text in [title_text, listing.select_one('.products-description')]:
-                    if text:
-                        if area is None:
-                            area = self.extract_area(text)
-                        if rooms is None:
-                            rooms = self.extract_rooms(text)
+                # Extract area, rooms and floor from both title and description
+                desc_text = _text(_first(nodes, 'products-description'))
+                meta = self.extract_meta(title_text, desc_text)
                 
                 # Extract location and date
-                location_elem = listing.select_one('.products-created')
-                if location_elem:
-                    location_parts = location_elem.text.strip().split(', ')
-                    location = location_parts[0] if len(location_parts) > 0 else None
+                location_text = _text(_first(nodes, 'products-created'))
+                location = (location_text.partition(', ')[0] or None) if location_text else None
+                
+                # Extract listing type from URL
+                url_lower = listing_url.lower()
+                if 'kiraye' in url_lower:
+                    listing_type = 'daily' if 'gunluk' in url_lower else 'monthly'
+                else:
+                    listing_type = 'sale'
                     
-                # Basic listing data
+                # Basic listing data, built in one go so the dict never resizes
                 listing_data = {
                     'listing_id': listing_id,
                     'source_url': listing_url,
@@ -729,127 +1165,186 @@ class TapAzScraper:
                     'title': title_text,
                     'price': price,
                     'currency': 'AZN',
-                    'area': area,
-                    'rooms': rooms,
+                    'area': meta['area'],
+                    'rooms': meta['rooms'],
+                    'floor': meta['floor'],
+                    'total_floors': meta['total_floors'],
                     'location': location,
-                    'created_at': datetime.datetime.now()
+                    'listing_type': listing_type,
+                    'created_at': now
                 }
                 
-                # Extract listing type from URL
-                if 'kiraye' in listing_url.lower():
-                    listing_data['listing_type'] = 'daily' if 'gunluk' in listing_url.lower() else 'monthly'
-                else:
-                    listing_data['listing_type'] = 'sale'
-                
                 listings.append(listing_data)
                 
             except Exception as e:
                 self.logger.error(f"Error parsing listing card: {str(e)}")
                 continue
                 
-        return listings
+        return listings, next_cursor
 
-    async def parse_listing_detail(self, html: str, listing_id: str) -> Dict:
-        """Parse the detailed listing page and fetch additional data"""
-        soup = BeautifulSoup(html, 'lxml')
+    def _handle_area(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the area ("Sahə") label"""
+        area = self.extract_area(value_text)
+        if area is not None:  # Only update if we got a valid area
+            data['area'] = area
+        else:
+            # Try to extract just the number if area extraction failed
+            try:
+                num = float(value_text.translate(_NUMBER_CHARS))
+                if 5 <= num <= 10000:
+                    data['area'] = round(num, 2)
+            except (ValueError, TypeError):
+                pass
+
+    def _handle_location(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the location ("Yerləşmə yeri") label"""
+        data['location'] = value_text
+        
+        # If location contains address-like information, update address field
+        if not any(x in value_lower for x in _ADDR_DISQUALIFIERS) and len(value_text) > 5:
+            data['address'] = value_text.strip()
+
+    def _handle_rooms(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the room count ("Otaq sayı") label"""
+        # The value is "3" or "3 otaq"; take the first run of digits
+        rooms_match = _DIGITS_RE.search(value_text)
+        if rooms_match:
+            rooms = int(rooms_match.group())
+            if 1 <= rooms <= 20:
+                data['rooms'] = rooms
+
+    def _handle_floor(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the floor ("Mərtəbə") label"""
+        floor_match = _FRACTION_RE.search(value_text)
+        if floor_match:
+            try:
+                floor = int(floor_match.group(1))
+                total_floors = int(floor_match.group(2))
+                if 0 <= floor <= 200 and 1 <= total_floors <= 200:
+                    data['floor'] = floor
+                    data['total_floors'] = total_floors
+            except (ValueError, IndexError):
+                pass
+
+    def _handle_listing_type(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the listing type ("Elanın tipi") label"""
+        listing_type = _match_keyword(_LISTING_TYPES, value_lower)
+        if listing_type:
+            data['listing_type'] = listing_type
+
+    def _handle_property_type(self, data: Dict, value_text: str, value_lower: str) -> None:
+        """Property row handler for the building type labels"""
+        property_type = _match_keyword(_PROPERTY_TYPES, value_lower)
+        if property_type:
+            data['property_type'] = property_type
+
+    # Label token -> handler, checked in order; the first token found in the label wins
+    _LABEL_HANDLERS = {
+        'sahə': _handle_area,
+        'yerləşmə yeri': _handle_location,
+        'otaq sayı': _handle_rooms,
+        'mərtəbə': _handle_floor,
+        'elanın tipi': _handle_listing_type,
+        'binanın tipi': _handle_property_type,
+        'əmlakın növü': _handle_property_type,
+    }
+
+    def _label_handler(self, label_lower: str):
+        """
+        Find the handler for a lowercased property label.
+        
+        tap.az mostly emits the labels verbatim, so an exact lookup usually hits;
+        otherwise the first token contained in the label wins ("sahə, m²"). The
+        result is remembered per label, so each distinct label is scanned once.
+        """
+        try:
+            return self._resolved_labels[label_lower]
+        except KeyError:
+            pass
+        
+        handler = self._LABEL_HANDLERS.get(label_lower.rstrip(':').strip())
+        if handler is None:
+            handler = next(
+                (candidate for token, candidate in self._LABEL_HANDLERS.items() if token in label_lower),
+                None
+            )
+        self._resolved_labels[label_lower] = handler
+        return handler
+
+    async def parse_listing_detail(self, html: str, listing_id: str, now: datetime.datetime,
+                                   phones_task: Optional[asyncio.Task] = None) -> Dict:
+        """
+        Parse the detailed listing page and fetch additional data.
+        
+        Args:
+            html: Detail page HTML
+            listing_id: Listing the page belongs to
+            now: Scrape timestamp stored as updated_at
+            phones_task: get_phone_numbers(listing_id) already in flight, if the caller
+                started it alongside the page fetch; otherwise it is requested here
+        """
+        data = await self._run_parser(_parse_listing_detail_worker, html, listing_id, now)
+        
+        # The detail page carries the CSRF token the phones API needs
+        if self._csrf_token is None:
+            self._csrf_token = self._extract_csrf(html)
+        
+        # Get phone numbers from API
+        phones = await (phones_task if phones_task is not None else self.get_phone_numbers(listing_id))
+        if phones:
+            # Clean up phone number format
+            data['contact_phone'] = phones[0].translate(_PHONE_CLEAN)
+        
+        return data
+
+    def _parse_listing_detail_sync(self, html: str, listing_id: str, now: datetime.datetime) -> Dict:
+        """Parse the detailed listing page (CPU-bound part, no network access)"""
+        soup = BeautifulSoup(html, 'lxml', parse_only=_LISTING_STRAINER)
         
         try:
             data = {
                 'listing_id': listing_id,
                 'source_website': 'tap.az',
-                'updated_at': datetime.datetime.now()
+                'updated_at': now
             }
             
+            # Property rows, title and description are shared with the extract_* helpers
+            texts = self._detail_texts(soup)
+            
             # Extract description
-            desc_elem = soup.select_one('.product-description__content')
-            if desc_elem:
-                data['description'] = desc_elem.text.strip()
+            if texts['description'] is not None:
+                data['description'] = texts['description']
             
             # Extract property details
-            for prop in soup.select('.product-properties__i'):
-                label = prop.select_one('.product-properties__i-name')
-                value = prop.select_one('.product-properties__i-value')
-                
-                if not label or not value:
-                    continue
-                    
-                label_text = label.text.strip().lower()
-                value_text = value.text.strip()
-                
-                if 'sahə' in label_text:
-                    area = self.extract_area(value_text)
-                    if area is not None:  # Only update if we got a valid area
-                        data['area'] = area
-                    else:
-                        # Try to extract just the number if area extraction failed
-                        try:
-                            num = float(re.sub(r'[^\d.]', '', value_text))
-                            if 5 <= num <= 10000:
-                                data['area'] = round(num, 2)
-                        except (ValueError, TypeError):
-                            pass
-                elif 'yerləşmə yeri' in label_text:
-                    data['location'] = value_text
-                    
-                    # If location contains address-like information, update address field
-                    if not any(x in value_text.lower() for x in ['metro', 'rayon', 'district']) and len(value_text) > 5:
-                        data['address'] = value_text.strip()
-                elif 'otaq sayı' in label_text:
-                    try:
-                        rooms = int(re.sub(r'[^\d]', '', value_text))
-                        if 1 <= rooms <= 20:
-                            data['rooms'] = rooms
-                    except (ValueError, TypeError):
-                        pass
-                elif 'mərtəbə' in label_text:
-                    # Extract floor information
-                    floor_match = re.search(r'(\d+)/(\d+)', value_text)
-                    if floor_match:
-                        try:
-                            floor = int(floor_match.group(1))
-                            total_floors = int(floor_match.group(2))
-                            if 0 <= floor <= 200 and 1 <= total_floors <= 200:
-                                data['floor'] = floor
-                                data['total_floors'] = total_floors
-                        except (ValueError, IndexError):
-                            pass
-                elif 'elanın tipi' in label_text:
-                    if 'kirayə' in value_text.lower():
-                        data['listing_type'] = 'monthly'
-                    elif 'satış' in value_text.lower():
-                        data['listing_type'] = 'sale'
-                elif 'binanın tipi' in label_text or 'əmlakın növü' in label_text:
-                    if 'yeni tikili' in value_text.lower():
-                        data['property_type'] = 'new'
-                    elif 'köhnə tikili' in value_text.lower():
-                        data['property_type'] = 'old'
-                    elif 'həyət evi' in value_text.lower():
-                        data['property_type'] = 'house'
-                    elif 'mənzil' in value_text.lower():
-                        data['property_type'] = 'apartment'
+            for _, label_lower, value_text in texts['rows']:
+                handler = self._label_handler(label_lower)
+                if handler:
+                    handler(self, data, value_text, value_text.lower())
             
             # Extract district using the dedicated method that validates against allowed list
-            district = self.extract_district(html)
+            district = self.extract_district(soup, texts)
             if district:
                 data['district'] = district
                 
             # Extract metro station using the dedicated method that validates against allowed list
-            metro_station = self.extract_metro_station(html)
+            metro_station = self.extract_metro_station(soup, texts)
             if metro_station:
                 data['metro_station'] = metro_station
             
             # Extract floor information if not already found
             if 'floor' not in data or 'total_floors' not in data:
-                for info_elem in soup.select('.product-properties, .product-description__content'):
-                    text = info_elem.text.strip().lower()
-                    floor, total = self.extract_floor_info(text)
+                for info_elem in self._SEL['floor_text'].select(soup):
+                    # extract_floor_info matches case-insensitively, so no lowercased copy is needed
+                    floor, total = self.extract_floor_info(info_elem.text.strip())
                     if floor is not None and 'floor' not in data:
                         data['floor'] = floor
                     if total is not None and 'total_floors' not in data:
                         data['total_floors'] = total
+                    if 'floor' in data and 'total_floors' in data:
+                        break
             
             # Extract amenities
-            amenities = self.extract_amenities(html)
+            amenities = self.extract_amenities(soup, texts)
             if amenities:
                 data['amenities'] = amenities
             
@@ -859,44 +1354,39 @@ class TapAzScraper:
                 data['latitude'] = lat
                 data['longitude'] = lon
             
-            # Get phone numbers from API
-            phones = await self.get_phone_numbers(listing_id)
-            if phones:
-                # Clean up phone number format
-                phone = phones[0].replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-                data['contact_phone'] = phone
+            nodes = texts['nodes']
             
             # Check WhatsApp availability
-            whatsapp_elem = soup.select_one('.wp_status_ico')
-            data['whatsapp_available'] = bool(whatsapp_elem)
+            data['whatsapp_available'] = 'wp_status_ico' in nodes
             
             # Get seller info
-            seller_info = soup.select_one('.product-owner__info-name')
-            if seller_info:
-                data['contact_type'] = seller_info.text.strip()
-            
-            # Extract photos
-            photos = []
-            photo_elems = soup.select('.product-photos__slider-top img')
-            for img in photo_elems:
-                src = img.get('src')
-                if src and not src.endswith('load.gif'):
-                    photos.append(src)
+            sellers = nodes.get('product-owner__info-name')
+            if sellers:
+                data['contact_type'] = _text(sellers[0])
+            
+            # Extract photos, skipping lazy-load placeholders; dict.fromkeys drops
+            # repeated slides while keeping their order
+            photos = list(dict.fromkeys(
+                src for slider in nodes.get('product-photos__slider-top', ())
+                for img in slider.find_all('img')
+                if (src := img.get('src')) and not src.endswith('load.gif')
+            ))
             
             if photos:
-                data['photos'] = json.dumps(photos)
+                data['photos'] = orjson.dumps(photos).decode()
             
             # Extract timestamps
-            info_stats = soup.select('.product-info__statistics__i-text')
-            for stat in info_stats:
-                if 'Bugün' in stat.text:
-                    data['listing_date'] = datetime.date.today()
-                elif 'Baxışların sayı' in stat.text:
-                    try:
-                        views = int(re.search(r'\d+', stat.text).group())
-                        data['views_count'] = views
-                    except (ValueError, AttributeError):
-                        pass
+            for stat in nodes.get('product-info__statistics__i-text', ()):
+                # Indented markup leaves whitespace before the label
+                stat_text = stat.text.strip()
+                # The views line starts with its label; the date follows a
+                # "Yeniləndi:" prefix, so it still needs a contains check
+                if stat_text.startswith('Baxışların sayı'):
+                    views_match = _DIGITS_RE.search(stat_text)
+                    if views_match:
+                        data['views_count'] = int(views_match.group())
+                elif 'Bugün' in stat_text:
+                    data['listing_date'] = now.date()
             
             return data
             
@@ -904,35 +1394,71 @@ class TapAzScraper:
             self.logger.error(f"Error parsing listing detail {listing_id}: {str(e)}")
             raise
 
+    async def process_listing_batch(self, listings: List[Dict], now: datetime.datetime) -> List[Dict]:
+        """Process a page of listings concurrently, keeping their order"""
+        tasks = [self._process_single_listing(listing, now) for listing in listings]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [r for r in results if isinstance(r, dict)]
+
+    async def _process_single_listing(self, listing: Dict, now: datetime.datetime) -> Optional[Dict]:
+        """Fetch and parse one listing detail, merged over its card data"""
+        async with self.semaphore:
+            # Once a CSRF token is cached the phones request does not depend on the
+            # detail page, so it runs alongside the page fetch
+            phones_task = None
+            if self._csrf_token is not None:
+                phones_task = asyncio.create_task(self.get_phone_numbers(listing['listing_id']))
+            try:
+                detail_html = await self.get_page_content(listing['source_url'])
+                detail_data = await self.parse_listing_detail(detail_html, listing['listing_id'], now, phones_task)
+                # The card dict is only used here, so detail fields are merged into it in place
+                listing.update(detail_data)
+                return listing
+            except Exception as e:
+                self.logger.error(f"Error processing listing {listing['listing_id']}: {str(e)}")
+                return None
+            finally:
+                if phones_task is not None:
+                    phones_task.cancel()
+
     async def run(self, pages: int = 2) -> List[Dict]:
         """Run the scraper for specified number of pages"""
+        # Listings page fetched ahead, while the previous page's details are processed
+        next_page = None
         try:
             self.logger.info("Starting Tap.az scraper")
             await self.init_session()
             
             all_results = []
             cursor = None
+            # Listing IDs already fetched this run; pages can overlap
+            seen_ids = set()
+            # One timestamp is shared by every listing scraped in this run
+            now = datetime.datetime.now()
             
             for page in range(pages):
                 try:
                     # Fetch and parse listings page
-                    html = await self.get_page_content(self.LISTINGS_URL, cursor)
-                    listings = await self.parse_listing_page(html)
+                    page_task, next_page = next_page, None
+                    if page_task is None:
+                        page_task = asyncio.create_task(self.get_page_content(self.LISTINGS_URL, cursor))
+                    html = await page_task
+                    listings, next_cursor = await self.parse_listing_page(html, now)
+                    listings = [
+                        l for l in listings
+                        if l['listing_id'] not in seen_ids and not seen_ids.add(l['listing_id'])
+                    ]
                     
                     # Update cursor for next page if available
-                    cursor_match = re.search(r'cursor=([^"]+)', html)
-                    if cursor_match:
-                        cursor = cursor_match.group(1)
+                    if next_cursor:
+                        cursor = next_cursor
                     
-                    # Fetch and parse each listing detail
-                    for listing in listings:
-                        try:
-                            detail_html = await self.get_page_content(listing['source_url'])
-                            detail_data = await self.parse_listing_detail(detail_html, listing['listing_id'])
-                            all_results.append({**listing, **detail_data})
-                        except Exception as e:
-                            self.logger.error(f"Error processing listing {listing['listing_id']}: {str(e)}")
-                            continue
+                    # Start on the next listings page before the detail fetches
+                    if page + 1 < pages:
+                        next_page = asyncio.create_task(self.get_page_content(self.LISTINGS_URL, cursor))
+                    
+                    # Fetch and parse the listing details concurrently
+                    all_results.extend(await self.process_listing_batch(listings, now))
                             
                 except Exception as e:
                     self.logger.error(f"Error processing page {page + 1}: {str(e)}")
@@ -945,4 +1471,82 @@ class TapAzScraper:
             return all_results
             
         finally:
-            await self.close_session()
\ No newline at end of file
+            if next_page is not None:
+                next_page.cancel()
+            await self.close_session()
+
+
+# Process pool for the CPU-bound parsing, one per process and shared by every
+# scraper instance. BeautifulSoup builds its tree in Python callbacks that hold
+# the GIL, so worker threads would not parse in parallel; worker processes do.
+_parse_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+# Forwards the workers' log records to this process's handlers
+_parse_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Return the parse pool, starting it on first use.
+    
+    Workers are spawned rather than forked: forking from inside a running event
+    loop (with its threads and sockets) is unsafe. Spawned workers do not inherit
+    the logging setup, so their records travel back over a queue.
+    """
+    global _parse_executor, _parse_log_listener
+    if _parse_executor is None:
+        context = multiprocessing.get_context('spawn')
+        log_queue = context.Queue()
+        root = logging.getLogger()
+        _parse_log_listener = logging.handlers.QueueListener(
+            log_queue, *(root.handlers or [logging.lastResort]), respect_handler_level=True
+        )
+        _parse_log_listener.start()
+        _parse_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=context,
+            initializer=_init_parse_worker,
+            initargs=(log_queue, root.getEffectiveLevel()),
+        )
+    return _parse_executor
+
+def _shutdown_parse_pool():
+    """Shut the parse pool down, joining its workers, and stop the log forwarding"""
+    global _parse_executor, _parse_log_listener
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=True)
+        _parse_executor = None
+    if _parse_log_listener is not None:
+        _parse_log_listener.stop()
+        _parse_log_listener = None
+
+def _discard_parse_pool(broken: concurrent.futures.ProcessPoolExecutor):
+    """
+    Shut down a broken parse pool so the next _parse_pool() call starts a fresh one.
+    
+    Its workers are already gone, so this returns quickly. Every parse in flight
+    on the pool fails at once; only the first to get here shuts it down, the
+    others find it already replaced and leave the new one alone.
+    """
+    if _parse_executor is broken:
+        _shutdown_parse_pool()
+
+def _init_parse_worker(log_queue, level: int):
+    """Send the worker's log records to the parent process"""
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+# Parsing entry points for the process pool. They are module-level so they can
+# be pickled; each worker process parses with its own scraper instance.
+_worker_scraper: Optional[TapAzScraper] = None
+
+def _get_worker_scraper() -> TapAzScraper:
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = TapAzScraper()
+    return _worker_scraper
+
+def _parse_listing_page_worker(html: str, now: datetime.datetime) -> Tuple[List[Dict], Optional[str]]:
+    return _get_worker_scraper()._parse_listing_page_sync(html, now)
+
+def _parse_listing_detail_worker(html: str, listing_id: str, now: datetime.datetime) -> Dict:
+    return _get_worker_scraper()._parse_listing_detail_sync(html, listing_id, now)
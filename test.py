@@ -277,6 +277,7 @@ async def run_scraper(scraper_name):
     finally:
         if connection:
             connection.close()
+        await TapAzScraper.close_parse_pool()
 
 async def main():
     """Main function"""